@@ -1,151 +1,837 @@
+import copy
 import logging
+import pickle
+import queue
 import time
 import sys
+import threading
 import yaml
 import os
+import signal
+from collections import OrderedDict, deque, namedtuple
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from plugins import gpio_bus
 from plugins.motor import Motor
 from plugins.ultrasonic import UltrasonicSensor
 from plugins.relay import Relay
-from plugins.govee_plugin import GoveeLight
-from plugins.music_player import MP3Player
+
+# Prefer the libyaml C loader; fall back to the pure-Python one when
+# PyYAML was built without it. All YAML in this project is parsed
+# through _YamlLoader so the speedup applies everywhere.
+try:
+    from yaml import CSafeLoader as _YamlLoader
+    _YAML_LOADER_NAME = 'CSafeLoader'
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+    _YAML_LOADER_NAME = 'SafeLoader'
 
 
 current_dir = os.path.dirname(os.path.abspath(__file__))
 
-config_file = yaml.safe_load(open(f"{current_dir}/configs.yaml"))
-hardware_config = config_file['hardware']
-motor_pins = hardware_config['motor_pins']
-pump_relay_pin = hardware_config['pump_relay_pin']
-smoke_relay_pin = hardware_config['smoke_relay_pin']
-ultrasonic_pins = hardware_config['ultrasonic_pins']
-govee_light_config = hardware_config['govee_light']
-
-distances = config_file['distance_thresholds']
-warning_distance = distances['warning']
-trigger_distance = distances['trigger']
-
-# Initialize hardware
-light = GoveeLight(govee_light_config['ip_address'])
-motor = Motor(motor_pins['forward'], motor_pins['reverse'])
-pump_relay = Relay(pump_relay_pin)
-smoke_relay = Relay(smoke_relay_pin)
-ultrasonic = UltrasonicSensor(ultrasonic_pins['trigger'], ultrasonic_pins['echo'])
-
-# Initialize music players
-music_files = {
-    'vomit_1_sec.mp3': MP3Player(f"{current_dir}/music_files/vomit_1_sec.mp3"),
-    'vomit_2_sec.mp3': MP3Player(f"{current_dir}/music_files/vomit_2_sec.mp3"),
-    'vomit_4_sec.mp3': MP3Player(f"{current_dir}/music_files/vomit_4_sec.mp3")
-}
-
-# Relay mapping
-relays = {
-    'pump': pump_relay,
-    'smoke': smoke_relay
-}
+# Parsed-YAML cache: absolute path -> (mtime, size, parsed dict).
+# Parsing dominates load time, so unchanged files are served from here.
+_YAML_CACHE = OrderedDict()
+_YAML_CACHE_MAX = 16
 
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
-logger = logging.getLogger("HalloweenBarrel")
+# Required config structure, checked once per parse via set differences
+_REQUIRED_SECTIONS = frozenset({'distance_thresholds', 'hardware', 'validation', 'timing'})
+_REQUIRED_DISTANCE_KEYS = frozenset({'warning', 'trigger'})
+_REQUIRED_TIMING_KEYS = frozenset({'reading_interval', 'trigger_cooldown'})
 
-def execute_sequence(sequence_config):
+def _validate_config(config):
     """
-    Execute a sequence of actions from YAML configuration.
-    
+    Check that the parsed config has every required section and key.
+
     Args:
-        sequence_config: List of action dictionaries from YAML config
+        config: Parsed configuration dictionary
+
+    Raises:
+        ValueError: If a required section or key is missing
     """
-    for action in sequence_config:
+    missing = _REQUIRED_SECTIONS - config.keys()
+    if missing:
+        raise ValueError(f"Config missing sections: {', '.join(sorted(missing))}")
+    missing = _REQUIRED_DISTANCE_KEYS - config['distance_thresholds'].keys()
+    if missing:
+        raise ValueError(f"distance_thresholds missing keys: {', '.join(sorted(missing))}")
+    missing = _REQUIRED_TIMING_KEYS - config['timing'].keys()
+    if missing:
+        raise ValueError(f"timing missing keys: {', '.join(sorted(missing))}")
+
+def load_config(path):
+    """
+    Load a YAML config file, reusing the parsed result while the file
+    is unchanged on disk.
+
+    Cache entries are keyed by absolute path and validated against the
+    file's (mtime, size), so editing the file invalidates its entry.
+    Callers get a deep copy and can mutate it freely.
+
+    Args:
+        path: Path to the YAML file
+
+    Returns:
+        Parsed configuration dictionary
+    """
+    key = os.path.abspath(path)
+    st = os.stat(key)
+    cached = _YAML_CACHE.get(key)
+    if cached and cached[0] == st.st_mtime and cached[1] == st.st_size:
+        _YAML_CACHE.move_to_end(key)
+        return copy.deepcopy(cached[2])
+
+    # Second level: a pickle sidecar stamped with the YAML's mtime, so a
+    # fresh process skips the YAML parse entirely when the file hasn't
+    # changed since the previous run
+    sidecar = key + '.pkl'
+    try:
+        with open(sidecar, 'rb') as f:
+            stamp, config = pickle.load(f)
+        if stamp == st.st_mtime_ns:
+            _YAML_CACHE[key] = (st.st_mtime, st.st_size, config)
+            return copy.deepcopy(config)
+    except (OSError, pickle.PickleError, EOFError, ValueError):
+        pass
+
+    # One-shot binary slurp: configs are tiny, so a single read into
+    # bytes beats streaming, and the loader decodes UTF-8 itself
+    try:
+        with open(key, 'rb') as f:
+            data = f.read()
+    except OSError as e:
+        raise RuntimeError(f"Failed to read config file {key}: {e}")
+    config = yaml.load(data, Loader=_YamlLoader)
+    # Validate on miss only; cache hits serve the already-validated tree
+    _validate_config(config)
+    try:
+        # Write-then-rename so a crash mid-dump can't leave a truncated
+        # sidecar for the next start to trip over
+        with open(sidecar + '.tmp', 'wb') as f:
+            pickle.dump((st.st_mtime_ns, config), f, pickle.HIGHEST_PROTOCOL)
+        os.replace(sidecar + '.tmp', sidecar)
+    except OSError:
+        # The sidecar is best-effort; a read-only filesystem just means
+        # the next start parses the YAML again
+        pass
+    _YAML_CACHE[key] = (st.st_mtime, st.st_size, config)
+    if len(_YAML_CACHE) > _YAML_CACHE_MAX:
+        _YAML_CACHE.popitem(last=False)
+    return copy.deepcopy(config)
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+if _YAML_LOADER_NAME != 'CSafeLoader':
+    logging.getLogger("HalloweenBarrel").debug(
+        "libyaml not available, YAML parsing uses the pure-Python loader")
+
+# Threshold classification of one reading; a namedtuple so the hot loop
+# allocates a small fixed tuple instead of hashing dict keys
+Thresholds = namedtuple('Thresholds', 'warning trigger')
+
+@dataclass(frozen=True, slots=True)
+class BarrelConfig:
+    """
+    Immutable snapshot of the numeric settings the hot loop reads.
+
+    Built once from the validated config dict; frozen slots make every
+    field a fixed-offset read and guard against accidental mutation at
+    runtime.
+    """
+    warning: float
+    trigger: float
+    min_valid: float
+    max_valid: float
+    tolerance: float
+    consecutive_readings: int
+    max_failed_readings: int
+    reading_interval: float
+    cooldown: float
+    early_trigger: bool
+
+    @classmethod
+    def from_dict(cls, config):
+        """
+        Build a snapshot from a parsed configuration dictionary.
+
+        Args:
+            config: Validated configuration dictionary
+
+        Returns:
+            BarrelConfig with typed, defaulted fields
+        """
+        distances = config['distance_thresholds']
+        validation = config.get('validation', {})
+        timing = config.get('timing', {})
+        return cls(
+            warning=float(distances['warning']),
+            trigger=float(distances['trigger']),
+            min_valid=float(validation.get('minimum_valid', 2.0)),
+            max_valid=float(validation.get('maximum_valid', 400.0)),
+            tolerance=float(validation.get('consistency_tolerance', 30.0)),
+            consecutive_readings=int(validation.get('consecutive_readings', 3)),
+            max_failed_readings=int(validation.get('max_failed_readings', 15)),
+            reading_interval=float(timing.get('reading_interval', 0.06)),
+            cooldown=float(timing.get('trigger_cooldown', 5.0)),
+            early_trigger=bool(timing.get('early_trigger', False)),
+        )
+
+class HalloweenBarrelController:
+    """
+    Top-level controller for the Halloween barrel.
+
+    Owns every hardware component, validates sensor readings, and runs
+    the main detection loop. Threshold and validation values are hoisted
+    out of the config dict into plain attributes once at construction so
+    the per-reading hot path does no nested dict lookups, and __slots__
+    keeps every attribute access a fixed-offset load.
+    """
+
+    __slots__ = (
+        'config', 'cfg', 'logger', '_stop_event',
+        'light', 'motor', 'pump_relay', 'smoke_relay',
+        'ultrasonic', 'ultrasonic_2', 'music_files', 'relays',
+        '_last_rgb',
+        'reading_history', '_hist_min', '_hist_max', '_hist_count',
+        '_last_hist_id', '_last_consistent', '_pending_pair',
+        'trigger_timeline', '_sensor_pool', '_dist_q',
+        '_sequence_thread', '_cooldown_until',
+        '_health_ok', '_failed_reads',
+        '_optional', '_threshold_lut', '_cleanables',
+    )
+
+    def __init__(self, config):
+        """
+        Initialize the controller from a parsed configuration dict.
+
+        Args:
+            config: Configuration dictionary from load_config()
+        """
+        self.config = config
+        self.logger = logging.getLogger("HalloweenBarrel")
+        # Set from signal context by stop(); the run loop tests it and
+        # is woken from its queue wait by a sentinel
+        self._stop_event = threading.Event()
+
+        # Hot-path values, snapshotted once from the nested config dicts
+        self.cfg = BarrelConfig.from_dict(config)
+        self._optional = config.get('optional_components', {})
+
+        # Precomputed classification per whole centimetre: the thresholds
+        # are fixed, so each reading becomes an index into this table
+        # instead of fresh comparisons and a new tuple. Only three
+        # classifications exist, so the table holds three shared
+        # instances rather than 500 distinct ones
+        clear = Thresholds(False, False)
+        warn = Thresholds(True, False)
+        near = Thresholds(True, True)
+        self._threshold_lut = tuple(
+            near if d < self.cfg.trigger else warn if d < self.cfg.warning else clear
+            for d in range(500)
+        )
+
+        # Hardware handles, created by initialize_hardware() so building
+        # a controller doesn't touch GPIO, the network or the audio system
+        self.light = None
+        self.motor = None
+        self.pump_relay = None
+        self.smoke_relay = None
+        self.ultrasonic = None
+        self.ultrasonic_2 = None
+        self.music_files = {}
+        self.relays = {}
+        self._last_rgb = None
+        # Teardown callables registered as components come up, released
+        # in reverse order by cleanup()
+        self._cleanables = []
+
+        # Bounded ring buffer: the deque evicts the oldest reading itself
+        self.reading_history = deque(maxlen=self.cfg.consecutive_readings)
+        # Monotonic deques of (value, sequence number) keeping the window
+        # min and max at the front, so the consistency check is O(1)
+        self._hist_min = deque()
+        self._hist_max = deque()
+        self._hist_count = 0
+        # Consistency verdict cache, keyed by the history counter
+        self._last_hist_id = -1
+        self._last_consistent = False
+        # Latest unpaired reading per sensor; run() pairs the two
+        # sensors' readings each cycle and records only the shorter of
+        # each pair, so two sensors seeing different baselines don't
+        # interleave into one history and trip the consistency check
+        self._pending_pair = {}
+        self.trigger_timeline = None
+
+        # The sensors use disjoint GPIO pairs, so their echo waits can overlap
+        self._sensor_pool = ThreadPoolExecutor(max_workers=2)
+        # Readings posted by the sensor monitor threads; the run loop
+        # blocks here instead of polling on a timer
+        self._dist_q = queue.Queue(maxsize=8)
+        # Trigger sequences run on their own thread so sensing continues
+        # underneath them; the loop suppresses re-triggers while one is
+        # live and until the cooldown deadline passes
+        self._sequence_thread = None
+        self._cooldown_until = 0.0
+        # Health is a flag flipped on failure events, not recomputed in
+        # the loop; check_system_health() is the diagnostic that sets it
+        self._health_ok = True
+        self._failed_reads = 0
+
+    def initialize_hardware(self):
+        """Initialize all hardware components from the configuration."""
+        hardware_config = self.config['hardware']
+        motor_pins = hardware_config['motor_pins']
+        ultrasonic_pins = hardware_config['ultrasonic_pins']
+        ultrasonic_2_pins = hardware_config.get('ultrasonic_2_pins') or {}
+        optional = self._optional
+
+        if optional.get('govee_light', True):
+            # Imported here so a disabled light costs no import or socket
+            from plugins.govee_plugin import GoveeLight
+            self.light = GoveeLight(hardware_config['govee_light']['ip_address'])
+            self._cleanables.append(self.light.close)
+        self.motor = Motor(motor_pins['forward'], motor_pins['reverse'])
+        self._cleanables.append(self.motor.cleanup)
+        self.pump_relay = Relay(hardware_config['pump_relay_pin'])
+        self._cleanables.append(self.pump_relay.cleanup)
+        self.smoke_relay = Relay(hardware_config['smoke_relay_pin'])
+        self._cleanables.append(self.smoke_relay.cleanup)
+        self.ultrasonic = UltrasonicSensor(ultrasonic_pins['trigger'], ultrasonic_pins['echo'])
+        self._cleanables.append(self.ultrasonic.cleanup)
+        if (optional.get('ultrasonic_2', True)
+                and ultrasonic_2_pins.get('trigger') and ultrasonic_2_pins.get('echo')):
+            self.ultrasonic_2 = UltrasonicSensor(ultrasonic_2_pins['trigger'],
+                                                 ultrasonic_2_pins['echo'])
+            self._cleanables.append(self.ultrasonic_2.cleanup)
+
+        # Music players; the import drags in pygame, so skip it entirely
+        # when music is disabled
+        if optional.get('music_player', True):
+            from plugins.music_player import MP3Player
+            self.music_files = {
+                'vomit_1_sec.mp3': MP3Player(f"{current_dir}/music_files/vomit_1_sec.mp3"),
+                'vomit_2_sec.mp3': MP3Player(f"{current_dir}/music_files/vomit_2_sec.mp3"),
+                'vomit_4_sec.mp3': MP3Player(f"{current_dir}/music_files/vomit_4_sec.mp3")
+            }
+            # Decode every clip into memory now, resolving the audio
+            # device once, so trigger-time playback is just starting a
+            # buffer on a mixer channel
+            players = list(self.music_files.values())
+            devices = players[0].get_devices()
+            device = devices[0] if devices else None
+            for player in players:
+                player.preload(device)
+                self._cleanables.append(player.stop)
+
+        # Relay mapping
+        self.relays = {
+            'pump': self.pump_relay,
+            'smoke': self.smoke_relay
+        }
+
+    def _compile_action(self, action):
+        """
+        Resolve one action dictionary to a (callable, args) opcode.
+
+        All dict lookups, name resolution and defaulting happen here,
+        once; executing the opcode is just a call.
+
+        Args:
+            action: Action dictionary from YAML config
+
+        Returns:
+            (callable, args) tuple, or None if the action can't run
+
+        Raises:
+            ValueError: If the action names a relay or music file that
+                doesn't exist. Bad names are config typos, so they fail
+                at compile time rather than logging mid-sequence.
+        """
         action_type = action.get('type')
-        
+
+        if action_type == 'motor':
+            motor_action = action.get('action')
+            if motor_action == 'forward':
+                return (self.motor.start_forward, ())
+            if motor_action == 'reverse':
+                return (self.motor.start_reverse, ())
+            if motor_action == 'stop':
+                return (self.motor.stop, ())
+        elif action_type == 'relay':
+            relay = self.relays.get(action.get('name'))
+            if not relay:
+                raise ValueError(f"Unknown relay name in sequence: {action.get('name')}")
+            relay_action = action.get('action')
+            if relay_action == 'on':
+                return (relay.on, ())
+            if relay_action == 'off':
+                return (relay.off, ())
+        elif action_type == 'light':
+            if not self.light:
+                self.logger.warning("Light action skipped: no light configured")
+                return None
+            light_action = action.get('action')
+            if light_action == 'set_color':
+                colour = action.get('colour', {})
+                return (self._set_light_color,
+                        (colour.get('r', 0), colour.get('g', 0), colour.get('b', 0)))
+            if light_action == 'flash':
+                # Flashing is seconds of LAN round trips; run it on the
+                # light's own flash thread so the sequence keeps moving
+                return (self.light.start_flash, (action.get('amount', 10),))
+        elif action_type == 'music':
+            if action.get('action') == 'play':
+                if not self.music_files:
+                    # Disabled optional component, like the light above:
+                    # skip, don't fail — the sequence names are fine
+                    self.logger.warning("Music action skipped: music player disabled")
+                    return None
+                player = self.music_files.get(action.get('file'))
+                if not player:
+                    raise ValueError(f"Unknown music file in sequence: {action.get('file')}")
+                return (player.play, ())
+
+        self.logger.warning(f"Unknown action: {action}")
+        return None
+
+    def compile_timeline(self, sequence_config):
+        """
+        Precompute a sequence into (offset, callable, args) opcodes.
+
+        Sleep actions become time offsets rather than executed actions,
+        blocking motor movements advance the offset by their duration,
+        and every other action is resolved to a bound callable, so the
+        executor fires each opcode at an absolute deadline with no dict
+        lookups or string dispatch left at run time.
+
+        Args:
+            sequence_config: List of action dictionaries from YAML config
+
+        Returns:
+            List of (offset_seconds, callable, args) tuples sorted by offset
+        """
+        timeline = []
+        offset = 0.0
+        for action in sequence_config:
+            action_type = action.get('type')
+            if action_type == 'sleep':
+                offset += action.get('duration', 1.0)
+                continue
+            op = self._compile_action(action)
+            if op is not None:
+                timeline.append((offset, op[0], op[1]))
+            if action_type == 'motor' and action.get('action') in ('forward', 'reverse'):
+                # Movements compile to a non-blocking start plus a stop
+                # scheduled at the end of the movement window, so the
+                # executor thread is free in between
+                offset += action.get('duration', 2.0)
+                timeline.append((offset, self.motor.stop, ()))
+        return timeline
+
+    def run_timeline(self, timeline):
+        """
+        Execute a compiled timeline against absolute monotonic deadlines.
+
+        Args:
+            timeline: List of (offset_seconds, callable, args) tuples
+                from compile_timeline
+        """
+        start = time.monotonic()
+        for offset, fn, args in timeline:
+            delay = start + offset - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            try:
+                fn(*args)
+            except Exception as e:
+                self.logger.error(f"Error executing {fn.__name__}{args}: {e}")
+
+    def _set_light_color(self, red, green, blue):
+        """
+        Set the Govee light to the given RGB color.
+
+        No-op color sets are skipped: sequences often re-assert the color
+        they already set, and each set is a UDP datagram to the bulb.
+
+        Args:
+            red: Red component (0-255)
+            green: Green component (0-255)
+            blue: Blue component (0-255)
+        """
+        if (red, green, blue) == self._last_rgb:
+            return
+        self.logger.info(f"Setting light color to RGB({red}, {green}, {blue})")
+        if self.light.set_color(red, green, blue):
+            self._last_rgb = (red, green, blue)
+
+    def _validate_distance_reading(self, distance):
+        """
+        Check that a single reading is inside the sensor's usable range.
+
+        Args:
+            distance: Distance reading in cm
+
+        Returns:
+            bool: True if the reading is physically plausible
+        """
+        if distance is None:
+            return False
+        if not (self.cfg.min_valid <= distance <= self.cfg.max_valid):
+            self.logger.debug("Discarding out-of-range reading: %.1f cm", distance)
+            return False
+        return True
+
+    def _validate_reading_consistency(self):
+        """
+        Check that the recent readings agree with each other.
+
+        A person walking up produces a smooth ramp of distances; electrical
+        noise produces wild jumps. Readings are consistent when the spread
+        across the history window is inside the configured tolerance.
+
+        The verdict is cached against the history counter, so repeated
+        calls between readings (health checks, threshold probes) cost a
+        single comparison.
+
+        Returns:
+            bool: True if the history is full and its spread is within tolerance
+        """
+        if self._hist_count == self._last_hist_id:
+            return self._last_consistent
+
+        consistent = len(self.reading_history) >= self.cfg.consecutive_readings
+        if consistent:
+            spread = self._hist_max[0][0] - self._hist_min[0][0]
+            if spread > self.cfg.tolerance:
+                self.logger.debug("Inconsistent readings, spread %.1f cm", spread)
+                consistent = False
+        self._last_hist_id = self._hist_count
+        self._last_consistent = consistent
+        return consistent
+
+    def _record_reading(self, distance):
+        """
+        Append a reading to the history and update the min/max deques.
+
+        Each deque stays monotonic (increasing for min, decreasing for
+        max): dominated entries are evicted from the back on append, and
+        entries older than the history window fall off the front.
+
+        Args:
+            distance: Validated distance reading in cm
+        """
+        self.reading_history.append(distance)
+        self._hist_count += 1
+        expired = self._hist_count - self.cfg.consecutive_readings
+
+        while self._hist_min and self._hist_min[-1][0] >= distance:
+            self._hist_min.pop()
+        self._hist_min.append((distance, self._hist_count))
+        if self._hist_min[0][1] <= expired:
+            self._hist_min.popleft()
+
+        while self._hist_max and self._hist_max[-1][0] <= distance:
+            self._hist_max.pop()
+        self._hist_max.append((distance, self._hist_count))
+        if self._hist_max[0][1] <= expired:
+            self._hist_max.popleft()
+
+    def _reset_history(self):
+        """Forget all recent readings, e.g. after running a sequence."""
+        self.reading_history.clear()
+        self._hist_min.clear()
+        self._hist_max.clear()
+        self._hist_count = 0
+        self._last_hist_id = -1
+        self._last_consistent = False
+        self._pending_pair.clear()
+
+    def check_distance_thresholds(self, distance):
+        """
+        Classify a validated distance against the configured thresholds.
+
+        Classification is served from the precomputed one-centimetre
+        lookup table, so no tuple is allocated per reading.
+
+        Args:
+            distance: Validated distance reading in cm
+
+        Returns:
+            Thresholds tuple with warning and trigger booleans
+        """
+        return self._threshold_lut[min(int(distance), 499)]
+
+    def check_system_health(self):
+        """
+        Verify that every required component is present and responsive.
+
+        Returns:
+            bool: True if all required components look healthy
+        """
+        healthy = True
+        if not self.motor or not self.motor.is_initialized():
+            self.logger.error("Health check failed: motor not initialized")
+            healthy = False
+        for name, relay in self.relays.items():
+            if not relay.is_initialized():
+                self.logger.error("Health check failed: %s relay not initialized", name)
+                healthy = False
+        if not self._test_ultrasonic_sensors():
+            self.logger.error("Health check failed: no working ultrasonic sensor")
+            healthy = False
+        self._health_ok = healthy
+        if healthy:
+            self._failed_reads = 0
+        return healthy
+
+    def _test_ultrasonic_sensors(self, probes=3):
+        """
+        Probe each configured sensor a few times, both in parallel.
+
+        The probes run concurrently on the sensor pool so the test takes
+        one sensor's worth of wall time instead of the sum of both.
+
+        Args:
+            probes: Number of test readings per sensor
+
+        Returns:
+            bool: True if at least one sensor returned a valid reading
+        """
+        def _probe(sensor):
+            valid = 0
+            for _ in range(probes):
+                if sensor.read_distance() is not None:
+                    valid += 1
+            return valid
+
+        sensors = [s for s in (self.ultrasonic, self.ultrasonic_2) if s is not None]
+        futures = [self._sensor_pool.submit(_probe, sensor) for sensor in sensors]
+        working = False
+        for sensor, future in zip(sensors, futures):
+            try:
+                valid = future.result()
+            except Exception as e:
+                self.logger.error("Sensor self-test failed: %s", e)
+                continue
+            self.logger.info("Sensor test: %d/%d valid readings", valid, probes)
+            if valid:
+                working = True
+        return working
+
+    def setup_hardware(self):
+        """Run the one-time setup sequence from the configuration."""
+        self.logger.info("Running hardware setup sequence")
+        self.run_timeline(self.compile_timeline(self.config.get('setup_sequence', [])))
+
+    def _on_distance(self, sensor_idx, distance):
+        """
+        Receive a reading from one sensor's monitor thread.
+
+        Args:
+            sensor_idx: Index of the reporting sensor (0 or 1)
+            distance: Distance reading in cm
+        """
         try:
-            if action_type == 'motor':
-                motor_action = action.get('action')
-                if motor_action == 'forward':
-                    duration = action.get('duration', 2.0)
-                    logger.info(f"Moving forward for {duration} seconds")
-                    motor.move_forward(duration)
-                elif motor_action == 'reverse':
-                    duration = action.get('duration', 2.0)
-                    logger.info(f"Moving reverse for {duration} seconds")
-                    motor.move_reverse(duration)
-                elif motor_action == 'stop':
-                    logger.info("Stopping motor")
-                    motor.stop()
-            elif action_type == 'relay':
-                relay_name = action.get('name')
-                relay_action = action.get('action')
-                relay = relays.get(relay_name)
-                if not relay:
-                    logger.error(f"Unknown relay name: {relay_name}")
+            self._dist_q.put_nowait((sensor_idx, distance))
+        except queue.Full:
+            # The control loop is behind; dropping the sample is fine,
+            # fresher ones are right behind it
+            pass
+
+    def _sequence_in_progress(self):
+        """
+        Return True while a trigger sequence is running or cooling down.
+
+        The run loop keeps validating readings through this window so
+        the history stays warm, but does not fire another sequence.
+        """
+        if self._sequence_thread is not None and self._sequence_thread.is_alive():
+            return True
+        return time.monotonic() < self._cooldown_until
+
+    def _run_trigger_sequence(self):
+        """
+        Execute the trigger timeline on its own thread.
+
+        Runs off the control loop so the sensors keep posting readings
+        while the sequence plays; the cooldown deadline is stamped when
+        the last action completes.
+        """
+        self.run_timeline(self.trigger_timeline)
+        self._cooldown_until = time.monotonic() + self.cfg.cooldown
+
+    def _handle_distance(self, distance):
+        """
+        Record one settled reading and fire the trigger sequence if due.
+
+        With two sensors this receives the shorter reading of each
+        paired cycle, so the history tracks the closest object rather
+        than an interleaving of two different baselines.
+
+        Args:
+            distance: Validated distance reading in cm
+        """
+        self._record_reading(distance)
+        if not self._validate_reading_consistency():
+            return
+
+        thresholds = self.check_distance_thresholds(distance)
+        if thresholds.warning:
+            self.logger.info("Distance: %.1f cm", distance)
+            self.logger.info("Warning: Object is approaching")
+        if thresholds.trigger:
+            if self._sequence_in_progress():
+                return
+            self.logger.info("Distance: %.1f cm", distance)
+            self.logger.info("Trigger: Object is close")
+            self._sequence_thread = threading.Thread(
+                target=self._run_trigger_sequence, daemon=True
+            )
+            self._sequence_thread.start()
+            self._reset_history()
+
+    def run(self):
+        """
+        Run the main detection loop until stopped.
+
+        Each sensor's monitor thread paces its own readings (their echo
+        waits are kernel edge waits) and posts (sensor, distance) pairs
+        onto a queue; this loop just blocks on the queue, so it costs
+        no CPU while nothing is near the prop. With two sensors, the
+        readings are paired per cycle and the shorter of each pair is
+        recorded; with early_trigger set, a single sensor's reading
+        inside the trigger zone is acted on without waiting for its
+        partner.
+        """
+        self._stop_event.clear()
+        # Compile the trigger sequence into a timeline once up front
+        self.trigger_timeline = self.compile_timeline(self.config.get('sequence', []))
+
+        sensors = [s for s in (self.ultrasonic, self.ultrasonic_2) if s is not None]
+        for idx, sensor in enumerate(sensors):
+            sensor.set_distance_callback(
+                lambda distance, idx=idx: self._on_distance(idx, distance))
+            sensor.start_monitoring(self.cfg.reading_interval)
+        dual = len(sensors) == 2
+        pending = self._pending_pair
+        pending.clear()
+
+        try:
+            while not self._stop_event.is_set():
+                # Health is just a flag here; failures below flip it
+                if not self._health_ok:
+                    self.logger.error("System unhealthy, stopping detection loop")
+                    break
+
+                try:
+                    item = self._dist_q.get(timeout=1.0)
+                except queue.Empty:
+                    self._failed_reads += 1
+                    if self._failed_reads >= self.cfg.max_failed_readings:
+                        self._health_ok = False
+                    continue
+
+                if item is None:
+                    # stop() sentinel; the loop condition exits next pass
+                    continue
+
+                self._failed_reads = 0
+                sensor_idx, distance = item
+                if not self._validate_distance_reading(distance):
                     continue
-                if relay_action == 'on':
-                    logger.info(f"Turning {relay_name} relay ON")
-                    relay.on()
-                elif relay_action == 'off':
-                    logger.info(f"Turning {relay_name} relay OFF")
-                    relay.off()
-            elif action_type == 'light':
-                light_action = action.get('action')
-                if light_action == 'set_color':
-                    r = action.get('colour', {}).get('r', 0)
-                    g = action.get('colour', {}).get('g', 0)
-                    b = action.get('colour', {}).get('b', 0)
-                    logger.info(f"Setting light color to RGB({r}, {g}, {b})")
-                    light.set_color(r, g, b)
-                elif light_action == 'flash':
-                    amount = action.get('amount', 10)
-                    logger.info(f"Flashing light {amount} times")
-                    light.flash(amount)
-                    
-            elif action_type == 'music':
-                file_name = action.get('file')
-                music_action = action.get('action')
-                
-                if music_action == 'play':
-                    player = music_files.get(file_name)
-                    if not player:
-                        logger.error(f"Unknown music file: {file_name}")
-                        continue
-                    logger.info(f"Playing music: {file_name}")
-                    player.play()
-                    
-            elif action_type == 'sleep':
-                duration = action.get('duration', 1.0)
-                logger.debug(f"Sleeping for {duration} seconds")
-                time.sleep(duration)
-                
-            else:
-                logger.warning(f"Unknown action type: {action_type}")
-                
+
+                if not dual:
+                    self._handle_distance(distance)
+                    continue
+
+                if self.cfg.early_trigger and distance < self.cfg.trigger:
+                    # One sensor already reads inside the trigger zone;
+                    # its partner can only confirm, so act on it alone
+                    pending.clear()
+                    self._handle_distance(distance)
+                    continue
+
+                partner = pending.pop(1 - sensor_idx, None)
+                if partner is not None:
+                    # Both sensors reported this cycle; the closer object
+                    # is the one that matters
+                    self._handle_distance(distance if distance < partner else partner)
+                elif sensor_idx in pending:
+                    # Same sensor twice: its partner missed a cycle, so
+                    # settle the stale reading alone before holding this one
+                    self._handle_distance(pending.pop(sensor_idx))
+                    pending[sensor_idx] = distance
+                else:
+                    pending[sensor_idx] = distance
+        finally:
+            for sensor in sensors:
+                sensor.stop_monitoring()
+
+    def stop(self):
+        """
+        Ask the run loop to exit immediately.
+
+        Safe to call from a signal handler: setting the event and
+        poking a sentinel onto the distance queue wakes the loop out of
+        its blocking get() rather than waiting out the timeout.
+        """
+        self._stop_event.set()
+        try:
+            self._dist_q.put_nowait(None)
+        except queue.Full:
+            # The loop is awake processing readings; it will see the
+            # event on its next pass
+            pass
+
+    def cleanup(self):
+        """Release every hardware component that was initialized."""
+        self.logger.info("Cleaning up hardware")
+        # The motor pins are under software PWM, which a bare LOW write
+        # doesn't stop — the PWM threads would just keep toggling them —
+        # so zero the duty cycles first
+        if self.motor:
+            try:
+                self.motor.stop()
+            except Exception as e:
+                self.logger.error(f"Error stopping motor: {e}")
+        # Then kill the plain outputs in one batched write, so the pump
+        # and smoke relays are off immediately even if a per-component
+        # cleanup below stalls
+        try:
+            gpio_bus.all_outputs_low()
         except Exception as e:
-            logger.error(f"Error executing action {action}: {e}")
-            continue
+            self.logger.error(f"Error driving outputs low: {e}")
+        # Release components in reverse initialization order; a failure
+        # in one teardown doesn't skip the rest
+        for release in reversed(self._cleanables):
+            try:
+                release()
+            except Exception as e:
+                self.logger.error(f"Error in cleanup step {release}: {e}")
+        self._cleanables.clear()
+        self._sensor_pool.shutdown(wait=False)
 
-def setup_hardware():
-    """Setup hardware using sequence from YAML configuration."""
-    setup_sequence_config = config_file.get('setup_sequence', [])
-    logger.info("Running hardware setup sequence")
-    execute_sequence(setup_sequence_config)
 
 def main():
     """Main entry point."""
-    setup_hardware()
-    
-    # Load sequence from config
-    sequence_config = config_file.get('sequence', [])
-    
-    while True:
-        distance = ultrasonic.read_distance()
-        if not distance:
-            continue
-        if distance < warning_distance:
-            logger.info(f"Distance: {distance} cm")
-            logger.info("Warning: Object is approaching")
-        if distance < trigger_distance:
-            logger.info(f"Distance: {distance} cm")
-            logger.info("Trigger: Object is close")
-            execute_sequence(sequence_config)
+    config = load_config(f"{current_dir}/configs.yaml")
+    controller = HalloweenBarrelController(config)
+
+    def _handle_signal(signum, frame):
+        controller.stop()
+
+    signal.signal(signal.SIGTERM, _handle_signal)
+    signal.signal(signal.SIGINT, _handle_signal)
+
+    try:
+        controller.initialize_hardware()
+        controller.setup_hardware()
+        if not controller.check_system_health():
+            controller.logger.error("Startup health check failed")
+            return 1
+        controller.run()
+    finally:
+        controller.cleanup()
+    return 0
 
 if __name__ == "__main__":
     sys.exit(main())
-
@@ -3,6 +3,7 @@ import json
 import time
 import logging
 from typing import Dict, Any, Optional
+from threading import Thread, Event
 
 class GoveeLight:
     """
@@ -18,19 +19,28 @@ class GoveeLight:
     FLASH_DELAY = 0.3
     MAX_COLOR_VALUE = 255
     MIN_COLOR_VALUE = 0
-    
+    THREAD_TIMEOUT = 2.0
+
     def __init__(self, ip_address: str, port: int = DEFAULT_PORT) -> None:
         """
         Initialize the GoveeLight controller.
-        
+
         Args:
             ip_address: IP address of the Govee light device
             port: UDP port for communication (default: 4003)
         """
         self.ip_address = ip_address
         self.port = port
+        # One socket for the lifetime of the controller, bound once so
+        # every command reuses the same ephemeral port and replies can
+        # be received without blocking forever
         self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.socket.bind(('', 0))
+        self.socket.settimeout(0.5)
         self.logger = logging.getLogger(__name__)
+        self._flash_thread: Optional[Thread] = None
+        self._stop_flash_event = Event()
 
     def send_command(self, command: Dict[str, Any]) -> bool:
         """
@@ -138,6 +148,9 @@ class GoveeLight:
         success = True
         for i in range(amount):
             try:
+                if self._stop_flash_event.is_set():
+                    self.logger.info("Flash stopped early")
+                    break
                 if not self.turn_off():
                     success = False
                 time.sleep(delay)
@@ -152,7 +165,53 @@ class GoveeLight:
                 success = False
         
         return success
-    
+
+    def start_flash(self, amount: int = 10, delay: float = FLASH_DELAY) -> bool:
+        """
+        Flash the light on a background thread.
+
+        Each flash cycle blocks on two UDP sends plus delays, so a long
+        flash can stall the caller for seconds. This runs the same flash
+        loop on a daemon thread so the caller stays free.
+
+        Args:
+            amount: Number of times to flash (default: 10)
+            delay: Delay between on/off states in seconds (default: 0.3)
+
+        Returns:
+            bool: True if the flash thread started successfully, False otherwise
+        """
+        try:
+            # Stop any flash already in progress
+            self.stop_flash()
+
+            self._stop_flash_event.clear()
+            self._flash_thread = Thread(target=self.flash, args=(amount, delay), daemon=True)
+            self._flash_thread.start()
+            self.logger.info(f"Started background flash ({amount} times)")
+            return True
+        except Exception as e:
+            self.logger.error(f"Error starting background flash: {e}")
+            return False
+
+    def stop_flash(self) -> bool:
+        """
+        Stop a background flash and leave the light turned on.
+
+        Returns:
+            bool: True if stopped successfully, False otherwise
+        """
+        try:
+            if self._flash_thread and self._flash_thread.is_alive():
+                self._stop_flash_event.set()
+                self._flash_thread.join(timeout=self.THREAD_TIMEOUT)
+                self.turn_on()
+                self.logger.info("Background flash stopped")
+            return True
+        except Exception as e:
+            self.logger.error(f"Error stopping background flash: {e}")
+            return False
+
     def _validate_color_value(self, value: int) -> bool:
         """
         Validate that a color value is within the valid range.
@@ -0,0 +1,88 @@
+import atexit
+import RPi.GPIO as GPIO
+import logging
+
+"""
+Shared GPIO configuration for all hardware plugins.
+
+Every plugin used to call GPIO.setmode and GPIO.setup itself, so starting
+main.py configured the chip once per component (five times). This module
+sets BCM mode exactly once and remembers which pins are already configured,
+so repeat setup calls become no-ops.
+"""
+
+logger = logging.getLogger(__name__)
+
+_mode_set = False
+_output_pins = set()
+_input_pins = set()
+
+
+def ensure_bcm_mode() -> None:
+    """Set BCM pin numbering once for the whole process."""
+    global _mode_set
+    if not _mode_set:
+        GPIO.setmode(GPIO.BCM)
+        _mode_set = True
+        logger.debug("GPIO mode set to BCM")
+
+
+def setup_output(pin: int) -> None:
+    """
+    Configure a pin as an output, skipping pins already configured.
+
+    Args:
+        pin: GPIO pin number (BCM numbering)
+    """
+    ensure_bcm_mode()
+    if pin not in _output_pins:
+        GPIO.setup(pin, GPIO.OUT)
+        _output_pins.add(pin)
+        _input_pins.discard(pin)
+
+
+def setup_input(pin: int) -> None:
+    """
+    Configure a pin as an input, skipping pins already configured.
+
+    Args:
+        pin: GPIO pin number (BCM numbering)
+    """
+    ensure_bcm_mode()
+    if pin not in _input_pins:
+        GPIO.setup(pin, GPIO.IN)
+        _input_pins.add(pin)
+        _output_pins.discard(pin)
+
+
+def output_pins() -> frozenset:
+    """Return the set of pins currently configured as outputs."""
+    return frozenset(_output_pins)
+
+
+def all_outputs_low() -> None:
+    """
+    Drive every configured output pin low in one batched write.
+
+    RPi.GPIO accepts channel lists, so this is a single call instead of
+    one write per component — useful on shutdown paths with a time
+    budget.
+    """
+    if _output_pins:
+        pins = list(_output_pins)
+        GPIO.output(pins, [GPIO.LOW] * len(pins))
+
+
+def release() -> None:
+    """Release every pin this process configured, exactly once."""
+    global _mode_set
+    if _mode_set:
+        GPIO.cleanup()
+        _output_pins.clear()
+        _input_pins.clear()
+        _mode_set = False
+        logger.debug("GPIO released")
+
+
+# Whatever happens at shutdown, hand the pins back to the kernel
+atexit.register(release)
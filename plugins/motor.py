@@ -3,6 +3,8 @@ import time
 import logging
 from typing import Optional
 
+from plugins import gpio_bus
+
 class Motor:
     """
     A motor control class for Raspberry Pi GPIO.
@@ -21,6 +23,10 @@ class Motor:
     MIN_DURATION = 0.1  # Minimum movement duration in seconds
     MAX_DURATION = 60.0  # Maximum movement duration in seconds
     DEFAULT_DURATION = 2.0  # Default movement duration in seconds
+    PWM_FREQUENCY = 1000  # PWM frequency in Hz
+    MIN_SPEED = 1  # Minimum speed (% duty cycle)
+    MAX_SPEED = 100  # Maximum speed (% duty cycle)
+    DEFAULT_SPEED = 100  # Default speed (% duty cycle)
     
     def __init__(self, forward_pin: int, reverse_pin: int) -> None:
         """
@@ -38,7 +44,8 @@ class Motor:
         self.reverse_pin = reverse_pin
         self.logger = logging.getLogger(__name__)
         self._is_initialized = False
-        
+        self._pin_state = None  # Last (forward, reverse) levels written
+
         # Validate pin numbers
         if not self._validate_pin(forward_pin) or not self._validate_pin(reverse_pin):
             raise ValueError(f"Invalid pin numbers: {forward_pin}, {reverse_pin}")
@@ -47,11 +54,17 @@ class Motor:
             raise ValueError("Forward and reverse pins must be different")
         
         try:
-            # Set up GPIO
-            GPIO.setmode(GPIO.BCM)
-            GPIO.setup(self.forward_pin, GPIO.OUT)
-            GPIO.setup(self.reverse_pin, GPIO.OUT)
-            
+            # Set up GPIO through the shared bus
+            gpio_bus.setup_output(self.forward_pin)
+            gpio_bus.setup_output(self.reverse_pin)
+
+            # Drive both pins with PWM so speed can be controlled via
+            # duty cycle; 100% duty behaves like the old binary drive
+            self._forward_pwm = GPIO.PWM(self.forward_pin, self.PWM_FREQUENCY)
+            self._reverse_pwm = GPIO.PWM(self.reverse_pin, self.PWM_FREQUENCY)
+            self._forward_pwm.start(0)
+            self._reverse_pwm.start(0)
+
             # Ensure motor is stopped initially
             self._stop_motor()
             self._is_initialized = True
@@ -62,11 +75,27 @@ class Motor:
             self.logger.error(f"Failed to initialize motor: {e}")
             raise RuntimeError(f"GPIO setup failed: {e}")
     
+    def _drive(self, forward_duty: float, reverse_duty: float) -> None:
+        """
+        Drive both motor pins at the given PWM duty cycles.
+
+        Skips the write entirely when both pins already hold the target
+        duty cycles, so redundant ensure-other-pin-off writes cost nothing.
+
+        Args:
+            forward_duty: Duty cycle for the forward pin (0-100)
+            reverse_duty: Duty cycle for the reverse pin (0-100)
+        """
+        if (forward_duty, reverse_duty) == self._pin_state:
+            return
+        self._forward_pwm.ChangeDutyCycle(forward_duty)
+        self._reverse_pwm.ChangeDutyCycle(reverse_duty)
+        self._pin_state = (forward_duty, reverse_duty)
+
     def _stop_motor(self) -> None:
         """Stop the motor by turning off both forward and reverse pins."""
         try:
-            GPIO.output(self.forward_pin, GPIO.LOW)
-            GPIO.output(self.reverse_pin, GPIO.LOW)
+            self._drive(0, 0)
         except Exception as e:
             self.logger.error(f"Error stopping motor: {e}")
     
@@ -95,68 +124,86 @@ class Motor:
             bool: True if duration is valid, False otherwise
         """
         return self.MIN_DURATION <= duration <= self.MAX_DURATION
-    
-    def move_forward(self, duration: float = DEFAULT_DURATION) -> bool:
+
+    def _validate_speed(self, speed: float) -> bool:
+        """
+        Validate that a speed is within acceptable limits.
+
+        Args:
+            speed: Speed to validate (% duty cycle)
+
+        Returns:
+            bool: True if speed is valid, False otherwise
+        """
+        return self.MIN_SPEED <= speed <= self.MAX_SPEED
+
+    def move_forward(self, duration: float = DEFAULT_DURATION, speed: float = DEFAULT_SPEED) -> bool:
         """
         Move motor forward for specified duration.
-        
+
         Args:
             duration: Duration in seconds to keep motor running
-            
+            speed: Speed as a PWM duty cycle percentage (1-100)
+
         Returns:
             bool: True if movement completed successfully, False otherwise
-            
+
         Raises:
-            ValueError: If duration is invalid
+            ValueError: If duration or speed is invalid
             RuntimeError: If motor is not initialized or GPIO operation fails
         """
         if not self._is_initialized:
             self.logger.error("Motor not initialized")
             raise RuntimeError("Motor not initialized")
-        
+
         if not self._validate_duration(duration):
             raise ValueError(f"Duration must be between {self.MIN_DURATION} and {self.MAX_DURATION} seconds")
-        
+
+        if not self._validate_speed(speed):
+            raise ValueError(f"Speed must be between {self.MIN_SPEED} and {self.MAX_SPEED} percent")
+
         try:
-            self.logger.info(f"Moving forward for {duration} seconds...")
-            GPIO.output(self.reverse_pin, GPIO.LOW)  # Ensure reverse is off
-            GPIO.output(self.forward_pin, GPIO.HIGH)  # Turn on forward
+            self.logger.info(f"Moving forward for {duration} seconds at {speed}% speed...")
+            self._drive(speed, 0)  # Forward on, reverse off
             time.sleep(duration)
-            GPIO.output(self.forward_pin, GPIO.LOW)  # Stop motor
+            self._drive(0, 0)  # Stop motor
             self.logger.info("Forward movement complete")
             return True
         except Exception as e:
             self.logger.error(f"Error during forward movement: {e}")
             self._stop_motor()  # Ensure motor stops on error
             return False
-    
-    def move_reverse(self, duration: float = DEFAULT_DURATION) -> bool:
+
+    def move_reverse(self, duration: float = DEFAULT_DURATION, speed: float = DEFAULT_SPEED) -> bool:
         """
         Move motor reverse for specified duration.
-        
+
         Args:
             duration: Duration in seconds to keep motor running
-            
+            speed: Speed as a PWM duty cycle percentage (1-100)
+
         Returns:
             bool: True if movement completed successfully, False otherwise
-            
+
         Raises:
-            ValueError: If duration is invalid
+            ValueError: If duration or speed is invalid
             RuntimeError: If motor is not initialized or GPIO operation fails
         """
         if not self._is_initialized:
             self.logger.error("Motor not initialized")
             raise RuntimeError("Motor not initialized")
-        
+
         if not self._validate_duration(duration):
             raise ValueError(f"Duration must be between {self.MIN_DURATION} and {self.MAX_DURATION} seconds")
-        
+
+        if not self._validate_speed(speed):
+            raise ValueError(f"Speed must be between {self.MIN_SPEED} and {self.MAX_SPEED} percent")
+
         try:
-            self.logger.info(f"Moving reverse for {duration} seconds...")
-            GPIO.output(self.forward_pin, GPIO.LOW)  # Ensure forward is off
-            GPIO.output(self.reverse_pin, GPIO.HIGH)  # Turn on reverse
+            self.logger.info(f"Moving reverse for {duration} seconds at {speed}% speed...")
+            self._drive(0, speed)  # Reverse on, forward off
             time.sleep(duration)
-            GPIO.output(self.reverse_pin, GPIO.LOW)  # Stop motor
+            self._drive(0, 0)  # Stop motor
             self.logger.info("Reverse movement complete")
             return True
         except Exception as e:
@@ -164,6 +211,66 @@ class Motor:
             self._stop_motor()  # Ensure motor stops on error
             return False
     
+    def start_forward(self, speed: float = DEFAULT_SPEED) -> bool:
+        """
+        Start moving forward without blocking; pair with stop().
+
+        Args:
+            speed: Speed as a PWM duty cycle percentage (1-100)
+
+        Returns:
+            bool: True if the motor started successfully, False otherwise
+
+        Raises:
+            ValueError: If speed is invalid
+            RuntimeError: If motor is not initialized
+        """
+        if not self._is_initialized:
+            self.logger.error("Motor not initialized")
+            raise RuntimeError("Motor not initialized")
+
+        if not self._validate_speed(speed):
+            raise ValueError(f"Speed must be between {self.MIN_SPEED} and {self.MAX_SPEED} percent")
+
+        try:
+            self.logger.info(f"Starting forward at {speed}% speed...")
+            self._drive(speed, 0)
+            return True
+        except Exception as e:
+            self.logger.error(f"Error starting forward movement: {e}")
+            self._stop_motor()
+            return False
+
+    def start_reverse(self, speed: float = DEFAULT_SPEED) -> bool:
+        """
+        Start moving reverse without blocking; pair with stop().
+
+        Args:
+            speed: Speed as a PWM duty cycle percentage (1-100)
+
+        Returns:
+            bool: True if the motor started successfully, False otherwise
+
+        Raises:
+            ValueError: If speed is invalid
+            RuntimeError: If motor is not initialized
+        """
+        if not self._is_initialized:
+            self.logger.error("Motor not initialized")
+            raise RuntimeError("Motor not initialized")
+
+        if not self._validate_speed(speed):
+            raise ValueError(f"Speed must be between {self.MIN_SPEED} and {self.MAX_SPEED} percent")
+
+        try:
+            self.logger.info(f"Starting reverse at {speed}% speed...")
+            self._drive(0, speed)
+            return True
+        except Exception as e:
+            self.logger.error(f"Error starting reverse movement: {e}")
+            self._stop_motor()
+            return False
+
     def stop(self) -> bool:
         """
         Stop the motor immediately.
@@ -188,6 +295,8 @@ class Motor:
         """
         try:
             self._stop_motor()
+            self._forward_pwm.stop()
+            self._reverse_pwm.stop()
             self._is_initialized = False
             self.logger.info(f"Motor on GPIO {self.forward_pin}/{self.reverse_pin} cleaned up")
         except Exception as e:
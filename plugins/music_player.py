@@ -42,6 +42,8 @@ class MP3Player:
         self.logger = logging.getLogger(__name__)
         self._volume = self._validate_volume(volume)
         self._thread: Optional[threading.Thread] = None
+        self._sound: Optional[pygame.mixer.Sound] = None
+        self._channel: Optional[pygame.mixer.Channel] = None
         
         # Validate file exists
         if not self.file_path.exists():
@@ -96,6 +98,8 @@ class MP3Player:
             # Apply volume to pygame mixer if it's initialized
             if pygame.mixer.get_init():
                 pygame.mixer.music.set_volume(validated_volume)
+            if self._sound is not None:
+                self._sound.set_volume(validated_volume)
             
             self.logger.info(f"Volume set to {validated_volume:.2f}")
             return True
@@ -133,6 +137,42 @@ class MP3Player:
         
         return max(self.MIN_VOLUME, min(self.MAX_VOLUME, float(volume)))
 
+    def preload(self, device: Optional[str] = None) -> bool:
+        """
+        Decode the audio file into memory so playback starts instantly.
+
+        Without preloading, play() opens and decodes the file at trigger
+        time; after preloading, play() just starts the decoded buffer on
+        a mixer channel.
+
+        Args:
+            device: Optional audio device name to use for playback
+
+        Returns:
+            bool: True if the file was decoded successfully, False otherwise
+        """
+        try:
+            if device is None:
+                devices = self.get_devices()
+                if not devices:
+                    self.logger.error("No audio devices available")
+                    return False
+                device = devices[0]
+
+            pygame.mixer.init(devicename=device)
+            self._sound = pygame.mixer.Sound(str(self.file_path))
+            self._sound.set_volume(self._volume)
+            self.logger.info(f"Preloaded audio: {self.file_path}")
+            return True
+        except pygame.error as e:
+            self.logger.error(f"Failed to preload {self.file_path}: {e}")
+            self._sound = None
+            return False
+        except Exception as e:
+            self.logger.error(f"Unexpected error preloading {self.file_path}: {e}")
+            self._sound = None
+            return False
+
     def play(self, device: Optional[str] = None) -> bool:
         """
         Start playing the MP3 file.
@@ -143,14 +183,28 @@ class MP3Player:
         Returns:
             bool: True if playback started successfully, False otherwise
         """
+        # Preloaded buffer: start it on a mixer channel, no file IO or
+        # decode at trigger time and no playback thread needed. Replaying
+        # the clip rewinds it rather than refusing or overlapping.
+        if self._sound is not None:
+            try:
+                self.rewind()
+                self._channel = self._sound.play()
+                self.is_playing = True
+                self.logger.info(f"Started playing (preloaded): {self.file_path}")
+                return True
+            except pygame.error as e:
+                self.logger.error(f"Error playing preloaded audio: {e}")
+                return False
+
         if self.is_playing:
             self.logger.warning("Already playing audio")
             return False
-        
+
         if not self.file_path.exists():
             self.logger.error(f"File '{self.file_path}' does not exist")
             return False
-        
+
         try:
             # Start playing the MP3 file in a separate thread
             self._thread = threading.Thread(target=self._play_in_thread, args=(device,))
@@ -162,6 +216,19 @@ class MP3Player:
             self.logger.error(f"Error starting playback: {e}")
             return False
 
+    def rewind(self) -> None:
+        """
+        Reset a preloaded clip so the next play() starts from the top.
+
+        Stops the clip's channel if it is still sounding; the decoded
+        buffer itself is untouched and stays resident.
+        """
+        if self._channel is not None:
+            if self._channel.get_busy():
+                self._channel.stop()
+            self._channel = None
+        self.is_playing = False
+
     def _play_in_thread(self, device: Optional[str] = None) -> None:
         """
         Internal method to play audio in a separate thread.
@@ -211,7 +278,11 @@ class MP3Player:
         """
         try:
             if self.is_playing:
-                pygame.mixer.music.stop()
+                if self._channel is not None:
+                    self._channel.stop()
+                    self._channel = None
+                else:
+                    pygame.mixer.music.stop()
                 self.is_playing = False
                 self.logger.info("Playback stopped")
                 return True
@@ -263,6 +334,8 @@ class MP3Player:
         Returns:
             bool: True if playing, False otherwise
         """
+        if self._channel is not None:
+            return self.is_playing and self._channel.get_busy()
         return self.is_playing and pygame.mixer.music.get_busy()
     
     def cleanup(self) -> None:
@@ -2,9 +2,11 @@ import RPi.GPIO as GPIO
 import time
 import threading
 import logging
-from typing import Optional, Callable
+from typing import Optional, Callable, List
 from threading import Event, Thread
 
+from plugins import gpio_bus
+
 class Relay:
     """
     A relay control class for Raspberry Pi GPIO.
@@ -53,10 +55,9 @@ class Relay:
             raise ValueError(f"Invalid pin number: {pin}")
         
         try:
-            # Set up GPIO
-            GPIO.setmode(GPIO.BCM)
-            GPIO.setup(self.pin, GPIO.OUT)
-            
+            # Set up GPIO through the shared bus
+            gpio_bus.setup_output(self.pin)
+
             # Set initial state
             self._set_gpio_state(initial_state)
             self._is_initialized = True
@@ -148,6 +149,44 @@ class Relay:
             self.logger.error(f"Error turning relay OFF: {e}")
             return False
     
+    @staticmethod
+    def set_many(relays: List["Relay"], state: bool) -> bool:
+        """
+        Set several relays to the same state with a single batched GPIO write.
+
+        Using the list form of GPIO.output issues one write for all pins
+        instead of one per relay, so the relays switch on the same edge.
+
+        Args:
+            relays: Relay instances to switch
+            state: True for ON, False for OFF
+
+        Returns:
+            bool: True if the batched write succeeded, False otherwise
+        """
+        logger = logging.getLogger(__name__)
+        relays = [relay for relay in relays if relay._is_initialized]
+        if not relays:
+            logger.error("No initialized relays to switch")
+            return False
+
+        pins = [relay.pin for relay in relays]
+        values = [
+            (GPIO.HIGH if state else GPIO.LOW) if relay.active_high
+            else (GPIO.LOW if state else GPIO.HIGH)
+            for relay in relays
+        ]
+
+        try:
+            GPIO.output(pins, values)
+            for relay in relays:
+                relay.state = state
+            logger.info(f"Relays on GPIO {pins} turned {'ON' if state else 'OFF'}")
+            return True
+        except Exception as e:
+            logger.error(f"Error switching relays {pins}: {e}")
+            return False
+
     def toggle(self) -> bool:
         """
         Toggle the relay state.
@@ -269,12 +308,9 @@ class Relay:
         Returns:
             bool: True if stopped early, False if completed normally
         """
-        start_time = time.time()
-        while time.time() - start_time < duration:
-            if stop_event.is_set():
-                return True
-            time.sleep(0.01)  # Small sleep to prevent busy waiting
-        return False
+        # Block on the stop event for the whole duration; the kernel
+        # wakes us at the deadline or immediately when stop is signalled
+        return stop_event.wait(duration)
     
     def start_pulse_pattern(self, on_time: float = 1.0, off_time: float = 1.0, count: Optional[int] = None) -> bool:
         """
@@ -2,9 +2,13 @@ import RPi.GPIO as GPIO
 import time
 import threading
 import logging
+from collections import deque
+from statistics import fmean
 from typing import Optional, List, Callable, Dict, Any
 from threading import Thread, Event
 
+from plugins import gpio_bus
+
 class UltrasonicSensor:
     """
     A comprehensive ultrasonic sensor class for Raspberry Pi GPIO.
@@ -22,7 +26,7 @@ class UltrasonicSensor:
     
     # Constants
     SPEED_OF_SOUND = 34300  # cm/s
-    TRIGGER_PULSE_DURATION = 0.00001  # 10μs
+    TRIGGER_PULSE_NS = 10_000  # 10μs trigger pulse width
     MIN_DISTANCE = 2.0  # cm (minimum reliable distance)
     MAX_DISTANCE_DEFAULT = 400.0  # cm (HC-SR04 max range)
     DEFAULT_TIMEOUT = 0.1  # seconds
@@ -52,7 +56,8 @@ class UltrasonicSensor:
         self.timeout = timeout
         self.logger = logging.getLogger(__name__)
         self._is_initialized = False
-        
+        self._edge_waits_supported = True
+
         # Validate parameters
         if not self._validate_pin(trigger_pin) or not self._validate_pin(echo_pin):
             raise ValueError(f"Invalid pin numbers: trigger={trigger_pin}, echo={echo_pin}")
@@ -68,8 +73,9 @@ class UltrasonicSensor:
         
         # Measurement tracking
         self.last_reading: Optional[float] = None
-        self.reading_history: List[float] = []
         self.max_history = self.MAX_HISTORY_DEFAULT
+        # Bounded ring buffer: the deque evicts the oldest reading itself
+        self.reading_history: deque = deque(maxlen=self.max_history)
         
         # Change detection
         self.change_threshold = self.DEFAULT_CHANGE_THRESHOLD
@@ -86,11 +92,10 @@ class UltrasonicSensor:
         self.monitor_interval = self.DEFAULT_MONITOR_INTERVAL
         
         try:
-            # Set up GPIO
-            GPIO.setmode(GPIO.BCM)
-            GPIO.setup(self.trigger_pin, GPIO.OUT)
-            GPIO.setup(self.echo_pin, GPIO.IN)
-            
+            # Set up GPIO through the shared bus
+            gpio_bus.setup_output(self.trigger_pin)
+            gpio_bus.setup_input(self.echo_pin)
+
             # Ensure trigger is low initially
             GPIO.output(self.trigger_pin, GPIO.LOW)
             
@@ -108,7 +113,14 @@ class UltrasonicSensor:
         """Send a 10μs trigger pulse."""
         try:
             GPIO.output(self.trigger_pin, GPIO.HIGH)
-            time.sleep(self.TRIGGER_PULSE_DURATION)
+            # Busy-wait rather than time.sleep: the scheduler can't reliably
+            # sleep for 10μs, so sleeping makes the pulse 10x too wide.
+            # The clock is bound to a local so each spin iteration is one
+            # call, not two attribute lookups plus a call
+            _clock = time.perf_counter_ns
+            deadline = _clock() + self.TRIGGER_PULSE_NS
+            while _clock() < deadline:
+                pass
             GPIO.output(self.trigger_pin, GPIO.LOW)
         except Exception as e:
             self.logger.error(f"Error sending trigger pulse: {e}")
@@ -116,35 +128,91 @@ class UltrasonicSensor:
     def _wait_for_echo(self, timeout: Optional[float] = None) -> Optional[float]:
         """
         Wait for echo signal and measure duration.
-        
+
+        Uses kernel edge detection (GPIO.wait_for_edge) so the process
+        sleeps instead of busy-polling the echo pin. Falls back to
+        polling if edge detection is unavailable on this platform.
+
         Args:
             timeout: Timeout in seconds (uses default if None)
-            
+
         Returns:
             Echo duration in seconds, or None if timeout or error
         """
         if timeout is None:
             timeout = self.timeout
-        
+
+        if self._edge_waits_supported:
+            try:
+                # One budget covers both edges: a sensor whose echo line
+                # sticks high costs at most `timeout`, not twice that
+                deadline = time.perf_counter() + timeout
+                timeout_ms = max(1, int(timeout * 1000))
+
+                # Wait for echo to start (LOW to HIGH)
+                if GPIO.wait_for_edge(self.echo_pin, GPIO.RISING, timeout=timeout_ms) is None:
+                    return None
+                echo_start = time.perf_counter()
+
+                # Wait for echo to end (HIGH to LOW) within what's left
+                remaining_ms = max(1, int((deadline - echo_start) * 1000))
+                if GPIO.wait_for_edge(self.echo_pin, GPIO.FALLING, timeout=remaining_ms) is None:
+                    return None
+
+                return time.perf_counter() - echo_start
+
+            except RuntimeError as e:
+                # Edge detection can fail (e.g. pin already in use); fall
+                # back to polling for the rest of the sensor's lifetime
+                self.logger.warning(f"Edge detection unavailable, falling back to polling: {e}")
+                self._edge_waits_supported = False
+            except Exception as e:
+                self.logger.error(f"Error waiting for echo edge: {e}")
+                return None
+
+        return self._wait_for_echo_polling(timeout)
+
+    def _wait_for_echo_polling(self, timeout: float) -> Optional[float]:
+        """
+        Wait for echo signal by polling the echo pin.
+
+        Fallback path for platforms where edge detection is unavailable.
+
+        Args:
+            timeout: Timeout in seconds
+
+        Returns:
+            Echo duration in seconds, or None if timeout or error
+        """
         try:
+            # Bind hot names to locals so each loop iteration avoids
+            # repeated global/attribute lookups
+            _clock = time.perf_counter
+            _input = GPIO.input
+            _echo = self.echo_pin
+            _low = GPIO.LOW
+            _high = GPIO.HIGH
+
+            # One deadline covers both edges, matching the edge-wait path
+            deadline = _clock() + timeout
+
             # Wait for echo to start (LOW to HIGH)
-            start_time = time.time()
-            while GPIO.input(self.echo_pin) == GPIO.LOW:
-                if time.time() - start_time > timeout:
+            while _input(_echo) == _low:
+                if _clock() > deadline:
                     return None
-            
+
             # Record echo start time
-            echo_start = time.time()
-            
+            echo_start = _clock()
+
             # Wait for echo to end (HIGH to LOW)
-            while GPIO.input(self.echo_pin) == GPIO.HIGH:
-                if time.time() - echo_start > timeout:
+            while _input(_echo) == _high:
+                if _clock() > deadline:
                     return None
-            
+
             # Calculate echo duration
-            echo_end = time.time()
+            echo_end = _clock()
             return echo_end - echo_start
-            
+
         except Exception as e:
             self.logger.error(f"Error waiting for echo: {e}")
             return None
@@ -187,24 +255,30 @@ class UltrasonicSensor:
         """
         return 0.01 <= timeout <= 1.0
     
-    def read_distance(self) -> Optional[float]:
+    def trigger(self) -> None:
         """
-        Read distance measurement from the ultrasonic sensor.
-        
+        Fire the trigger pulse without waiting for the echo.
+
+        Lets a caller with several sensors fire all triggers back-to-back
+        so the echo waits overlap; follow with read_echo().
+        """
+        self._send_trigger_pulse()
+
+    def read_echo(self) -> Optional[float]:
+        """
+        Measure the echo for a trigger pulse already sent.
+
         Returns:
             Distance in centimeters, or None if no valid reading
         """
         if not self._is_initialized:
             self.logger.error("Ultrasonic sensor not initialized")
             return None
-        
+
         try:
-            # Send trigger pulse
-            self._send_trigger_pulse()
-            
             # Wait for echo and measure duration
             echo_duration = self._wait_for_echo()
-            
+
             if echo_duration is None:
                 self.logger.debug("Ultrasonic sensor timeout - no echo received")
                 return None
@@ -226,11 +300,21 @@ class UltrasonicSensor:
             self._update_reading(distance)
             
             return distance
-            
+
         except Exception as e:
             self.logger.error(f"Error reading ultrasonic sensor: {e}")
             return None
-    
+
+    def read_distance(self) -> Optional[float]:
+        """
+        Read distance measurement from the ultrasonic sensor.
+
+        Returns:
+            Distance in centimeters, or None if no valid reading
+        """
+        self.trigger()
+        return self.read_echo()
+
     def _update_reading(self, distance: float) -> None:
         """
         Update reading history and check for changes.
@@ -245,10 +329,8 @@ class UltrasonicSensor:
             # Update current reading
             self.last_reading = distance
             
-            # Add to history
+            # Add to history (the deque drops the oldest entry itself)
             self.reading_history.append(distance)
-            if len(self.reading_history) > self.max_history:
-                self.reading_history.pop(0)
             
             # Check for significant changes
             if previous_reading is not None:
@@ -313,7 +395,7 @@ class UltrasonicSensor:
                 self.logger.warning("No valid readings obtained for average")
                 return None
             
-            average = sum(readings) / len(readings)
+            average = fmean(readings)
             self.logger.debug(f"Average distance from {len(readings)} readings: {average:.1f}cm")
             return average
             
@@ -326,9 +408,9 @@ class UltrasonicSensor:
         Get the reading history.
         
         Returns:
-            Copy of the reading history list
+            Copy of the reading history as a list
         """
-        return self.reading_history.copy()
+        return list(self.reading_history)
     
     def get_last_reading(self) -> Optional[float]:
         """
@@ -452,13 +534,10 @@ class UltrasonicSensor:
         try:
             while self.monitoring and not self._stop_monitoring_event.is_set():
                 self.read_distance()
-                
-                # Sleep with periodic stop checks
-                start_time = time.time()
-                while time.time() - start_time < self.monitor_interval:
-                    if self._stop_monitoring_event.is_set():
-                        break
-                    time.sleep(0.01)
+
+                # Block on the stop event instead of polling it; wakes
+                # immediately on stop or after the monitor interval
+                self._stop_monitoring_event.wait(self.monitor_interval)
         except Exception as e:
             self.logger.error(f"Error in monitoring loop: {e}")
         finally:
@@ -38,19 +38,15 @@ def setup_logging():
     )
     return logging.getLogger(__name__)
 
-def test_motor_initialization(logger):
-    """Test motor initialization with different pin configurations."""
+def test_motor_initialization(logger, motor):
+    """Test that the shared motor initialized correctly."""
     logger.info("=" * 50)
     logger.info("Testing Motor Initialization")
     logger.info("=" * 50)
-    
-    # Test valid pin configuration
+
     try:
-        logger.info("Testing valid pin configuration (18, 19)...")
-        motor = Motor(18, 19)
         if motor.is_initialized():
             logger.info("✅ Motor initialization successful")
-            motor.cleanup()
             return True
         else:
             logger.error("❌ Motor initialization failed - not initialized")
@@ -59,101 +55,97 @@ def test_motor_initialization(logger):
         logger.error(f"❌ Motor initialization failed: {e}")
         return False
 
-def test_motor_forward_movement(logger):
+def test_motor_forward_movement(logger, motor):
     """Test motor forward movement."""
     logger.info("=" * 50)
     logger.info("Testing Motor Forward Movement")
     logger.info("=" * 50)
-    
+
     try:
-        motor = Motor(18, 19)
         if not motor.is_initialized():
             logger.error("❌ Motor not initialized, skipping forward test")
             return False
-        
+
         logger.info("Moving motor forward for 2 seconds...")
         logger.info("⚠️  WARNING: Make sure motor is properly connected and safe to move!")
-        
+
         # Countdown before movement
         for i in range(3, 0, -1):
             logger.info(f"Starting in {i}...")
             time.sleep(1)
-        
+
         success = motor.move_forward(2.0)
         if success:
             logger.info("✅ Motor forward movement completed successfully")
         else:
             logger.error("❌ Motor forward movement failed")
-        
-        motor.cleanup()
+
+        motor.stop()
         return success
-        
+
     except Exception as e:
         logger.error(f"❌ Motor forward test failed: {e}")
         return False
 
-def test_motor_reverse_movement(logger):
+def test_motor_reverse_movement(logger, motor):
     """Test motor reverse movement."""
     logger.info("=" * 50)
     logger.info("Testing Motor Reverse Movement")
     logger.info("=" * 50)
-    
+
     try:
-        motor = Motor(18, 19)
         if not motor.is_initialized():
             logger.error("❌ Motor not initialized, skipping reverse test")
             return False
-        
+
         logger.info("Moving motor reverse for 2 seconds...")
         logger.info("⚠️  WARNING: Make sure motor is properly connected and safe to move!")
-        
+
         # Countdown before movement
         for i in range(3, 0, -1):
             logger.info(f"Starting in {i}...")
             time.sleep(1)
-        
+
         success = motor.move_reverse(2.0)
         if success:
             logger.info("✅ Motor reverse movement completed successfully")
         else:
             logger.error("❌ Motor reverse movement failed")
-        
-        motor.cleanup()
+
+        motor.stop()
         return success
-        
+
     except Exception as e:
         logger.error(f"❌ Motor reverse test failed: {e}")
         return False
 
-def test_motor_stop_functionality(logger):
+def test_motor_stop_functionality(logger, motor):
     """Test motor stop functionality."""
     logger.info("=" * 50)
     logger.info("Testing Motor Stop Functionality")
     logger.info("=" * 50)
-    
+
     try:
-        motor = Motor(18, 19)
         if not motor.is_initialized():
             logger.error("❌ Motor not initialized, skipping stop test")
             return False
-        
+
         logger.info("Testing motor stop functionality...")
-        
+
         # Test stop when motor is not moving
         success = motor.stop()
         if success:
             logger.info("✅ Motor stop (idle) successful")
         else:
             logger.error("❌ Motor stop (idle) failed")
-        
-        motor.cleanup()
+
         return success
-        
+
     except Exception as e:
         logger.error(f"❌ Motor stop test failed: {e}")
         return False
 
-def test_motor_error_handling(logger):
+def test_motor_error_handling(logger, motor):
     """Test motor error handling with invalid inputs."""
     logger.info("=" * 50)
     logger.info("Testing Motor Error Handling")
@@ -162,7 +154,7 @@ def test_motor_error_handling(logger):
     # Test invalid pin numbers
     try:
         logger.info("Testing invalid pin numbers...")
-        motor = Motor(99, 100)  # Invalid pins
+        Motor(99, 100)  # Invalid pins
         logger.error("❌ Should have raised ValueError for invalid pins")
         return False
     except ValueError as e:
@@ -174,7 +166,7 @@ def test_motor_error_handling(logger):
     # Test same pin for forward and reverse
     try:
         logger.info("Testing same pin for forward and reverse...")
-        motor = Motor(18, 18)  # Same pin
+        Motor(18, 18)  # Same pin
         logger.error("❌ Should have raised ValueError for same pins")
         return False
     except ValueError as e:
@@ -183,37 +175,30 @@ def test_motor_error_handling(logger):
         logger.error(f"❌ Unexpected error: {e}")
         return False
     
-    # Test invalid duration
+    # Duration validation runs against the shared motor; a rejected
+    # duration never starts the motor, so there is nothing to undo
     try:
-        motor = Motor(5, 6)
         logger.info("Testing invalid duration (negative)...")
         motor.move_forward(-1.0)
         logger.error("❌ Should have raised ValueError for negative duration")
-        motor.cleanup()
         return False
     except ValueError as e:
         logger.info(f"✅ Correctly caught ValueError: {e}")
-        motor.cleanup()
     except Exception as e:
         logger.error(f"❌ Unexpected error: {e}")
-        motor.cleanup()
         return False
-    
+
     try:
-        motor = Motor(5, 6)
         logger.info("Testing invalid duration (too long)...")
         motor.move_forward(100.0)  # Too long
         logger.error("❌ Should have raised ValueError for too long duration")
-        motor.cleanup()
         return False
     except ValueError as e:
         logger.info(f"✅ Correctly caught ValueError: {e}")
-        motor.cleanup()
     except Exception as e:
         logger.error(f"❌ Unexpected error: {e}")
-        motor.cleanup()
         return False
-    
+
     return True
 
 def test_motor_cleanup(logger):
@@ -222,12 +207,14 @@ def test_motor_cleanup(logger):
     logger.info("Testing Motor Cleanup")
     logger.info("=" * 50)
     
+    # Cleanup needs a throwaway instance on spare pins; tearing down
+    # the shared motor would break every test after this one
     try:
-        motor = Motor(5, 6)
+        motor = Motor(18, 19)
         if not motor.is_initialized():
             logger.error("❌ Motor not initialized, skipping cleanup test")
             return False
-        
+
         logger.info("Testing motor cleanup...")
         motor.cleanup()
         
@@ -251,8 +238,10 @@ def test_motor_context_manager(logger):
     
     try:
         logger.info("Testing motor context manager...")
-        
-        with Motor(5, 6) as motor:
+
+        # Spare pins again: the context manager cleans up on exit, which
+        # must not tear down the shared motor
+        with Motor(18, 19) as motor:
             if motor.is_initialized():
                 logger.info("✅ Motor initialized in context manager")
                 
@@ -275,18 +264,24 @@ def test_motor_context_manager(logger):
         logger.error(f"❌ Motor context manager test failed: {e}")
         return False
 
-def run_interactive_test(logger):
+# Interactive command table: key -> (description, action)
+INTERACTIVE_COMMANDS = {
+    'f': ("Moving forward", lambda motor: motor.move_forward(2.0)),
+    'r': ("Moving reverse", lambda motor: motor.move_reverse(2.0)),
+    's': ("Stopping motor", lambda motor: motor.stop()),
+}
+
+def run_interactive_test(logger, motor):
     """Run an interactive test where user can control the motor."""
     logger.info("=" * 50)
     logger.info("Interactive Motor Control Test")
     logger.info("=" * 50)
-    
+
     try:
-        motor = Motor(5, 6)
         if not motor.is_initialized():
             logger.error("❌ Motor not initialized, skipping interactive test")
             return False
-        
+
         logger.info("Interactive test started. You can control the motor manually.")
         logger.info("Commands:")
         logger.info("  'f' - Move forward for 2 seconds")
@@ -294,35 +289,32 @@ def run_interactive_test(logger):
         logger.info("  's' - Stop motor")
         logger.info("  'q' - Quit interactive test")
         logger.info("⚠️  WARNING: Make sure motor is properly connected and safe to move!")
-        
+
         while True:
             try:
                 command = input("\nEnter command (f/r/s/q): ").strip().lower()
-                
+
                 if command == 'q':
                     logger.info("Exiting interactive test...")
                     break
-                elif command == 'f':
-                    logger.info("Moving forward...")
-                    motor.move_forward(2.0)
-                elif command == 'r':
-                    logger.info("Moving reverse...")
-                    motor.move_reverse(2.0)
-                elif command == 's':
-                    logger.info("Stopping motor...")
-                    motor.stop()
+
+                entry = INTERACTIVE_COMMANDS.get(command)
+                if entry:
+                    description, action = entry
+                    logger.info(f"{description}...")
+                    action(motor)
                 else:
                     logger.info("Invalid command. Use f/r/s/q")
-                    
+
             except KeyboardInterrupt:
                 logger.info("\nExiting interactive test...")
                 break
             except Exception as e:
                 logger.error(f"Error during interactive test: {e}")
-        
-        motor.cleanup()
+
+        motor.stop()
         return True
-        
+
     except Exception as e:
         logger.error(f"❌ Interactive test failed: {e}")
         return False
@@ -339,29 +331,42 @@ def main():
     
     # Test results
     test_results = []
-    
-    # Run all tests
-    test_results.append(("Initialization", test_motor_initialization(logger)))
-    test_results.append(("Error Handling", test_motor_error_handling(logger)))
-    test_results.append(("Stop Functionality", test_motor_stop_functionality(logger)))
-    test_results.append(("Context Manager", test_motor_context_manager(logger)))
-    test_results.append(("Cleanup", test_motor_cleanup(logger)))
-    
-    # Ask user if they want to run movement tests
-    logger.info("\n" + "=" * 60)
-    response = input("Do you want to run movement tests? (y/n): ").strip().lower()
-    
-    if response == 'y':
-        test_results.append(("Forward Movement", test_motor_forward_movement(logger)))
-        test_results.append(("Reverse Movement", test_motor_reverse_movement(logger)))
-        
-        # Ask user if they want to run interactive test
-        response = input("Do you want to run interactive test? (y/n): ").strip().lower()
+
+    # One motor shared by every test: GPIO setup and cleanup each cost
+    # tens of milliseconds on the Pi, so the suite pays them once
+    # instead of once per test. Tests leave the motor stopped rather
+    # than tearing it down.
+    try:
+        motor = Motor(5, 6)
+    except Exception as e:
+        logger.error(f"❌ Could not create shared motor: {e}")
+        return 1
+
+    try:
+        # Run all tests
+        test_results.append(("Initialization", test_motor_initialization(logger, motor)))
+        test_results.append(("Error Handling", test_motor_error_handling(logger, motor)))
+        test_results.append(("Stop Functionality", test_motor_stop_functionality(logger, motor)))
+        test_results.append(("Context Manager", test_motor_context_manager(logger)))
+        test_results.append(("Cleanup", test_motor_cleanup(logger)))
+
+        # Ask user if they want to run movement tests
+        logger.info("\n" + "=" * 60)
+        response = input("Do you want to run movement tests? (y/n): ").strip().lower()
+
         if response == 'y':
-            test_results.append(("Interactive Test", run_interactive_test(logger)))
-    else:
-        logger.info("Skipping movement tests as requested.")
-    
+            test_results.append(("Forward Movement", test_motor_forward_movement(logger, motor)))
+            test_results.append(("Reverse Movement", test_motor_reverse_movement(logger, motor)))
+
+            # Ask user if they want to run interactive test
+            response = input("Do you want to run interactive test? (y/n): ").strip().lower()
+            if response == 'y':
+                test_results.append(("Interactive Test", run_interactive_test(logger, motor)))
+        else:
+            logger.info("Skipping movement tests as requested.")
+    finally:
+        motor.cleanup()
+
     # Print test results summary
     logger.info("\n" + "=" * 60)
     logger.info("TEST RESULTS SUMMARY")